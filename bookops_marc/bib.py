@@ -5,35 +5,152 @@ Module replaces pymarc's Record module. Inherits all Record class functinality a
 adds some syntactic sugar.
 """
 from datetime import date
-from typing import List, Optional, Dict
+from operator import attrgetter
+from sys import intern
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from pymarc import Record, Field, Indicators
 from pymarc.constants import LEADER_LEN
 
 from .errors import BookopsMarcError
 from .local_values import (
-    get_branch_code,
-    get_shelf_audience_code,
-    get_shelf_code,
     is_oclc_number,
     has_oclc_prefix,
     oclcNo_with_prefix,
     oclcNo_without_prefix,
     normalize_date,
     normalize_dewey,
-    normalize_location_code,
     normalize_order_number,
+    parse_location_code,
     shorten_dewey,
 )
 from .models import Order
 from .constants import SUPPORTED_THESAURI, SUPPORTED_SUBJECT_TAGS
 
 
+# leader record type and bibliographic level codes used by 008 accessors
+_AUDN_TYPES = frozenset("acdgijkmt")
+_AUDN_BIBLVL = frozenset("am")
+_FORM_SET1 = frozenset("acdijmopt")  # form of item in 008/23
+_FORM_SET2 = frozenset("efgk")  # form of item in 008/29
+
+# 082 indicators of full edition Dewey assigned by LC and by other agency
+_DDC_LC_FULL = Indicators("0", "0")
+_DDC_OTHER_FULL = Indicators("0", "4")
+
+# 998$e codes of bibs suppressed from public display
+_SUPPRESSED_CODES = frozenset("cenqov")
+
+# accepted values of the `sort` argument of `Bib.orders`
+_VALID_SORTS = frozenset(("ascending", "descending"))
+
+# subject tags as defined by `pymarc.Record.subjects`
+# fmt: off
+_SUBJECT_TAGS = frozenset((
+    "600", "610", "611", "630", "648", "650", "651", "653", "654", "655",
+    "656", "657", "658", "662", "690", "691", "696", "697", "698", "699",
+))
+# fmt: on
+
+# branch call number tag of each library
+_BRANCH_CALL_NO_TAGS = {"bpl": "099", "nypl": "091"}
+
+# read-only accessors that `Bib.batch_extract` accepts as columns
+_BATCH_COLUMNS = (
+    "audience",
+    "branch_call_no",
+    "branch_call_no_field",
+    "cataloging_date",
+    "control_number",
+    "created_date",
+    "dewey",
+    "dewey_shortened",
+    "form_of_item",
+    "languages",
+    "lccn",
+    "main_entry",
+    "oclc_nos",
+    "orders",
+    "overdrive_number",
+    "physical_description",
+    "record_type",
+    "sierra_bib_format",
+    "sierra_bib_id",
+    "sierra_bib_id_normalized",
+    "subjects_lc",
+    "suppressed",
+    "upc_number",
+)
+
+# main entry tags in order of precedence
+_MAIN_ENTRY_TAGS = ("100", "110", "111", "245")
+
+
+# reads `Field.tag`; used to snapshot tags for the tag index staleness check
+_get_tag = attrgetter("tag")
+
+
+def _normalize_library(library: str) -> str:
+    """
+    Lowercases and interns given library code, so comparisons against
+    literals such as "nypl" can short-circuit on identity
+
+    Args:
+        library:                'bpl' or 'nypl'
+    """
+    if isinstance(library, str):
+        return intern(library.lower())
+    return library
+
+
+def _is_supported_subject(field: Field) -> bool:
+    """
+    Determines if subject field uses a tag and thesaurus supported by BookOps
+
+    Args:
+        field:                  pymarc.Field instance of a subject tag
+    """
+    if field.tag not in SUPPORTED_SUBJECT_TAGS:
+        return False
+    ind2 = field.indicator2
+    if ind2 == "0":  # LCSH
+        return True
+    if ind2 == "7":
+        source = field.get(code="2")
+        return source is not None and source.strip() in SUPPORTED_THESAURI
+    return False
+
+
+def _subfield_map(field: Field) -> Dict[str, str]:
+    """
+    Maps subfield codes to values of their first occurrence in the field
+
+    Args:
+        field:                  pymarc.Field instance
+    """
+    subfields: Dict[str, str] = {}
+    for sub in field.subfields:
+        subfields.setdefault(sub.code, sub.value)
+    return subfields
+
+
 class Bib(Record):
     """
     A class for representing local MARC record.
     """
 
+    __slots__ = ("library", "_tag_idx_cache")
+
     def __init__(
         self,
         data: str = "",
@@ -45,6 +162,9 @@ class Bib(Record):
         leader: str = " " * LEADER_LEN,
         file_encoding: str = "iso8859-1",
     ) -> None:
+        self._tag_idx_cache: Optional[
+            Tuple[List[Field], List[str], Dict[str, List[Field]]]
+        ] = None
         super().__init__(
             data,
             to_unicode,
@@ -55,81 +175,156 @@ class Bib(Record):
             file_encoding,
         )
 
-        if isinstance(library, str):
-            self.library = library.lower()
-        else:
-            self.library = library
-
-    def __iter__(self):
-        self.pos = 0
-        return self
+        self.library = _normalize_library(library)
 
-    def __next__(self):
-        if self.pos >= len(self.fields):
-            raise StopIteration
-        self.pos += 1
-        return self.fields[self.pos - 1]
-
-    def _get_branches(self, field: Field) -> List[str]:
+    @classmethod
+    def _from_record(
+        cls, record: Record, library: str, copy_fields: bool = True
+    ) -> "Bib":
         """
-        Returns isolated from location codes branches as a list
+        Creates `Bib` from leader and fields of `pymarc.Record` without running
+        `Bib.__init__`
 
         Args:
-            field:                  pymarc.Field instance
+            record:                 `pymarc.Record` instance
+            library:                library code already normalized with
+                                    `_normalize_library`
+            copy_fields:            copy the list of fields or share it with
+                                    the record
         """
-        branches = []
-
-        for sub in field.get_subfields("t"):
-            # remove any qty data
-            loc_code = normalize_location_code(sub)
-
-            branch = get_branch_code(loc_code)
-            branches.append(branch)
+        bib = cls.__new__(cls)
+        bib.leader = record.leader
+        bib.fields = record.fields[:] if copy_fields else record.fields
+        bib.pos = 0
+        bib.force_utf8 = False
+        bib.to_unicode = True
+        bib._tag_idx_cache = None
+        bib.library = library
+        return bib
 
-        return branches
+    def __iter__(self) -> Iterator[Field]:
+        return iter(self.fields)
+
+    def _tag_index(self) -> Dict[str, List[Field]]:
+        """
+        Returns a mapping of tags to fields with the tag in the bib order.
+        The mapping is built lazily and rebuilt whenever `self.fields` no longer
+        holds the same field instances with the same tags in the same order as
+        when it was built, including direct edits of the list and of `field.tag`.
+        """
+        fields = self.fields
+        tags = list(map(_get_tag, fields))
+        cache = self._tag_idx_cache
+        # pymarc.Field compares by identity, so these are exact C-level checks
+        if cache is None or cache[1] != tags or cache[0] != fields:
+            idx: Dict[str, List[Field]] = {}
+            for field in fields:
+                # interned keys match tag literals of the accessors by identity
+                tag = intern(field.tag)
+                try:
+                    idx[tag].append(field)
+                except KeyError:
+                    idx[tag] = [field]
+            cache = self._tag_idx_cache = (fields[:], tags, idx)
+        return cache[2]
 
-    def _get_shelf_audience_codes(self, field: Field) -> List[Optional[str]]:
+    def _first_field(self, tag: str) -> Optional[Field]:
         """
-        Returns list of audience codes extracted from location codes
+        Returns the first field with given tag or None if not present
         """
-        audns = []
-
-        for sub in field.get_subfields("t"):
-            loc_code = normalize_location_code(sub)
+        fields = self._tag_index().get(tag)
+        if fields:
+            return fields[0]
+        return None
 
-            audn = get_shelf_audience_code(loc_code)
-            audns.append(audn)
+    def _first_subfield(self, tag: str, code: str) -> Optional[str]:
+        """
+        Returns value of given subfield of the first field with given tag
+        or None if either is not present
 
-        return audns
+        Args:
+            tag:                    MARC tag
+            code:                   subfield code
+        """
+        field = self._first_field(tag)
+        if field is None:
+            return None
+        return field.get(code)  # type: ignore
 
-    def _get_shelves(self, field: Field) -> List[Optional[str]]:
+    def _parse_locations(
+        self, field: Field
+    ) -> Tuple[List[str], List[Optional[str]], List[Optional[str]]]:
         """
-        Returns list of shelf codes extracted from location codes
+        Returns branches, audience codes, and shelf codes extracted in a single
+        pass from the location codes of the field
 
         Args:
             field:                  pymarc.Field instance
         """
+        branches = []
+        audns = []
         shelves = []
 
         for sub in field.get_subfields("t"):
-            # remove any qty data
-            loc_code = normalize_location_code(sub)
-
-            shelf = get_shelf_code(loc_code)
+            branch, audn, shelf = parse_location_code(sub)
+            branches.append(branch)
+            audns.append(audn)
             shelves.append(shelf)
 
-        return shelves
+        return branches, audns, shelves
+
+    @classmethod
+    def batch_extract(
+        cls, bibs: Iterable[Optional["Bib"]], columns: Sequence[str]
+    ) -> Dict[str, List[Any]]:
+        """
+        Extracts values returned by given accessor methods from each bib and
+        returns them organized by column
+
+        Args:
+            bibs:                   iterable of `bookops_marc.Bib` instances;
+                                    None items produce None in every column
+            columns:                unique names of read-only `Bib` accessor
+                                    methods, for example "sierra_bib_id" or
+                                    "dewey"
+
+        Returns:
+            dictionary of column names and lists of extracted values
+        """
+        accessors = []
+        for column in columns:
+            if column not in _BATCH_COLUMNS:
+                raise BookopsMarcError(f"Invalid column name: '{column}'.")
+            accessors.append(getattr(cls, column))
+        if len(set(columns)) != len(accessors):
+            raise BookopsMarcError("Duplicate column names are not allowed.")
+
+        data: Dict[str, List[Any]] = {column: [] for column in columns}
+        extractors = [
+            (data[column].append, accessor)
+            for column, accessor in zip(columns, accessors)
+        ]
+        for bib in bibs:
+            # SierraBibReader yields None in place of records it failed to parse
+            if bib is None:
+                for append, _ in extractors:
+                    append(None)
+                continue
+            for append, accessor in extractors:
+                append(accessor(bib))
+
+        return data
 
     def audience(self) -> Optional[str]:
         """
         Retrieves audience code from the 008 MARC tag
         """
-        try:
-            if self.leader[6] in "acdgijkmt" and self.leader[7] in "am":
-                return self.get("008").data[22]  # type: ignore
-            else:
-                return None
-        except AttributeError:
+        field = self._first_field("008")
+        # leader may be a pymarc.Leader or a plain string
+        leader = str(self.leader)
+        if field is not None and leader[6] in _AUDN_TYPES and leader[7] in _AUDN_BIBLVL:
+            return field.data[22]  # type: ignore
+        else:
             return None
 
     def branch_call_no(self) -> Optional[str]:
@@ -137,72 +332,63 @@ class Bib(Record):
         Retrieves branch library call number as string without any MARC coding
         """
         field = self.branch_call_no_field()
-        try:
-            return field.value()  # type:ignore
-        except AttributeError:
+        if field is None:
             return None
+        return field.value()
 
     def branch_call_no_field(self) -> Optional[Field]:
         """
         Retrieves a branch library call number field as pymarc.Field instance
         """
-        if self.library == "bpl":
-            return self.get("099")
-        elif self.library == "nypl":
-            return self.get("091")
-        else:
+        tag = _BRANCH_CALL_NO_TAGS.get(self.library)
+        if tag is None:
             return None
+        return self._first_field(tag)
 
     def cataloging_date(self) -> Optional[date]:
         """
         Extracts cataloging date from the bib
         """
-        try:
-            cat_date = normalize_date(self.get("907").get(code="b"))  # type: ignore
-            return cat_date
-        except AttributeError:
-            return None
+        value = self._first_subfield("907", "b")
+        if value:
+            return normalize_date(value)
+        return None
 
     def control_number(self) -> Optional[str]:
         """
         Returns a control number from the 001 tag if exists.
         """
-        try:
-            return self.get("001").data.strip()  # type: ignore
-        except AttributeError:
+        field = self._first_field("001")
+        if field is None or field.data is None:
             return None
+        return field.data.strip()
 
     def created_date(self) -> Optional[date]:
         """
         Extracts bib creation date
         """
-        try:
-            created_date = normalize_date(self.get("907").get(code="c"))  # type: ignore
-            return created_date
-        except AttributeError:
-            return None
+        value = self._first_subfield("907", "c")
+        if value:
+            return normalize_date(value)
+        return None
 
     def dewey(self) -> Optional[str]:
         """
         Returns LC suggested Dewey classification then other agency's number.
         Does not alter the class mark string.
         """
-        fields = self.get_fields("082")
+        other_agency = None
 
-        # check if LC full ed. present first
-        for field in fields:
-            if field.indicators == Indicators("0", "0"):
-                class_mark = field.get(code="a").strip()
-                class_mark = normalize_dewey(class_mark)
-                return class_mark  # type: ignore
-
-        # then other agency full ed.
-        for field in fields:
-            if field.indicators == Indicators("0", "4"):
-                class_mark = field.get(code="a").strip()
-                class_mark = normalize_dewey(class_mark)
-                return class_mark  # type: ignore
+        # LC full ed. takes precedence, otherwise first other agency full ed.
+        for field in self._tag_index().get("082", ()):
+            indicators = field.indicators
+            if indicators == _DDC_LC_FULL:
+                return normalize_dewey(field.get(code="a").strip())
+            elif other_agency is None and indicators == _DDC_OTHER_FULL:
+                other_agency = field
 
+        if other_agency is not None:
+            return normalize_dewey(other_agency.get(code="a").strip())
         return None
 
     def dewey_shortened(self) -> Optional[str]:
@@ -221,15 +407,15 @@ class Bib(Record):
         Returns form of item code from the 008 tag position 23 if applicable for
         a given material format
         """
-        rec_type = self.record_type()
+        field = self._first_field("008")
+        if field is None:
+            return None
 
-        if isinstance(rec_type, str) and "008" in self:
-            if rec_type in "acdijmopt":
-                return self.get("008").data[23]  # type: ignore
-            elif rec_type in "efgk":
-                return self.get("008").data[29]  # type: ignore
-            else:
-                return None
+        rec_type = self.leader[6]
+        if rec_type in _FORM_SET1:
+            return field.data[23]  # type: ignore
+        elif rec_type in _FORM_SET2:
+            return field.data[29]  # type: ignore
         else:
             return None
 
@@ -237,91 +423,85 @@ class Bib(Record):
         """
         Returns list of material main languages
         """
-        languages = []
-
-        try:
-            languages.append(self.get("008").data[35:38])  # type: ignore
-        except AttributeError:
-            pass
+        field = self._first_field("008")
+        if field is None:
+            languages = []
+        else:
+            languages = [field.data[35:38]]  # type: ignore
 
-        for field in self.get_fields("041"):
-            for sub in field.get_subfields("a"):
-                languages.append(sub)
+        for field in self._tag_index().get("041", ()):
+            languages.extend(field.get_subfields("a"))
         return languages
 
     def lccn(self) -> Optional[str]:
         """
         Returns Library of Congress Control Number
         """
-        try:
-            return self.get("010").get(code="a").strip()  # type: ignore
-        except (AttributeError, TypeError):
+        value = self._first_subfield("010", "a")
+        if value is None:
             return None
+        return value.strip()
 
     def main_entry(self) -> Optional[Field]:
         """
         Returns main entry field instance
         """
-        entry_fields = ["100", "110", "111", "245"]
-        for field in entry_fields:
-            if bool(self.get(field)):
-                return self.get(field)
-        else:
-            raise BookopsMarcError("Incomplete MARC record: missing the main entry.")
+        tag_index = self._tag_index()
+        for tag in _MAIN_ENTRY_TAGS:
+            fields = tag_index.get(tag)
+            if fields:
+                return fields[0]
+
+        raise BookopsMarcError("Incomplete MARC record: missing the main entry.")
 
     def normalize_oclc_control_number(self):
         """
         Enforces practices of recording OCLC prefix (BPL) or not (NYPL) in
         the 001 control field.
         """
+        if self.library == "bpl":
+            normalize = oclcNo_with_prefix
+        elif self.library == "nypl":
+            normalize = oclcNo_without_prefix
+        else:
+            raise BookopsMarcError(
+                "Not defined library argument to apply the correct practice."
+            )
+
         controlNo = self.control_number()
-        if is_oclc_number(controlNo):
-            if self.library == "bpl":
-                self["001"].data = oclcNo_with_prefix(controlNo)
-            elif self.library == "nypl":
-                self["001"].data = oclcNo_without_prefix(controlNo)
-            else:
-                raise BookopsMarcError(
-                    "Not defined library argument to apply the correct practice."
-                )
+        if controlNo is not None and is_oclc_number(controlNo):
+            self._first_field("001").data = normalize(controlNo)  # type: ignore
 
     def oclc_nos(self) -> Dict[str, str]:
         """
         Returns dictionary of MARC tags and OCLC identifiers found in a bib.
         """
         unique_oclcs = dict()
+        tag_index = self._tag_index()
 
         # get OCLC #s from 001
-        id_field = self.get("001")
-        source_field = self.get("003")
+        source_field = self._first_field("003")
         if source_field and "ocolc" in source_field.data.lower():
+            id_field = self._first_field("001")
             if id_field and is_oclc_number(id_field.data):
                 oclc_no = oclcNo_without_prefix(id_field.data)
                 unique_oclcs["001"] = oclc_no
 
         # get OCLC #s from 035
-        id_fields = self.get_fields("035")
-        if id_fields:
-            for field in id_fields:
-                try:
-                    value = field.get("a")
-                    if has_oclc_prefix(value):
-                        oclc_no = oclcNo_without_prefix(value)
-                        unique_oclcs["035"] = oclc_no
-                        break
-                except TypeError:
-                    continue
+        for field in tag_index.get("035", ()):
+            value = field.get("a")
+            if value is not None and has_oclc_prefix(value):
+                unique_oclcs["035"] = oclcNo_without_prefix(value)
+                break
 
         # for NYPL also check 991
         if self.library == "nypl":
-            id_fields = self.get_fields("991")
-            if id_fields:
-                for field in id_fields:
-                    value = field.get("y")
-                    if is_oclc_number(value):
-                        oclc_no = oclcNo_without_prefix(value)
-                        unique_oclcs["991"] = oclc_no
-                        break
+            for field in tag_index.get("991", ()):
+                value = field.get("y")
+                if is_oclc_number(value):
+                    oclc_no = oclcNo_without_prefix(value)
+                    unique_oclcs["991"] = oclc_no
+                    break
 
         return unique_oclcs
 
@@ -334,7 +514,7 @@ class Bib(Record):
                                     descending (from recent to oldest)
         """
 
-        if not isinstance(sort, str) or sort not in "ascending,descending":
+        if not isinstance(sort, str) or sort not in _VALID_SORTS:
             raise BookopsMarcError("Invalid 'sort' argument was passed.")
 
         orders = []
@@ -344,41 +524,39 @@ class Bib(Record):
         # is needed to connect these two;
         # it is possible 960 tag may not have related 961 (BPL)
 
-        for field in self:
+        fields = self.fields
+        last = len(fields) - 1
+        for i, field in enumerate(fields):
             if field.tag == "960":
                 # shared NYPL & BPL mapping
-                oid = normalize_order_number(field.get(code="z"))
-
-                audns = self._get_shelf_audience_codes(field)
-                branches = self._get_branches(field)
-                copies = int(field.get(code="o"))
-                form = field.get(code="g")
-                created = normalize_date(field.get(code="q"))
-                lang = field.get(code="w")
-                shelves = self._get_shelves(field)
-                status = field.get(code="m").strip()
-
-                try:
-                    venNotes = None
-                    following_field = self.fields[self.pos]
-                    if following_field.tag == "961":
-                        venNotes = following_field.get(code="h")
-                except IndexError:
-                    pass
-
-                o = Order(
-                    oid,
-                    audn=audns,
-                    branches=branches,
-                    copies=copies,
-                    created=created,
-                    form=form,
-                    lang=lang,
-                    shelves=shelves,
-                    status=status,
-                    venNotes=venNotes,
+                sf = _subfield_map(field)
+                oid = normalize_order_number(sf.get("z"))  # type: ignore
+
+                branches, audns, shelves = self._parse_locations(field)
+                copies = int(sf.get("o"))  # type: ignore
+                form = sf.get("g")
+                created = normalize_date(sf.get("q"))  # type: ignore
+                lang = sf.get("w")
+                status = sf.get("m").strip()  # type: ignore
+
+                venNotes = None
+                if i < last and fields[i + 1].tag == "961":
+                    venNotes = fields[i + 1].get(code="h")
+
+                orders.append(
+                    Order(
+                        oid,
+                        audns,
+                        branches,
+                        copies,
+                        created,
+                        form,
+                        lang,
+                        shelves,
+                        status,
+                        venNotes,
+                    )
                 )
-                orders.append(o)
 
         if sort == "descending":
             orders.reverse()
@@ -389,43 +567,44 @@ class Bib(Record):
         """
         Returns Overdrive Reserve ID parsed from the 037 tag.
         """
-        try:
-            return self.get("037").get(code="a").strip()  # type: ignore
-        except (AttributeError, TypeError):
+        value = self._first_subfield("037", "a")
+        if value is None:
             return None
+        return value.strip()
+
+    def remove_fields_where(self, predicate: Callable[[Field], bool]) -> None:
+        """
+        Deletes all fields for which given predicate returns True.
+        Fields are removed in a single pass, so prefer it over repeated
+        `remove_field` calls when deleting many fields.
+
+        Args:
+            predicate:              function that takes `pymarc.Field` and
+                                    returns True if the field is to be deleted
+        """
+        fields = self.fields
+        kept = [f for f in fields if not predicate(f)]
+
+        if len(kept) != len(fields):
+            fields[:] = kept
 
     def remove_unsupported_subjects(self) -> None:
         """
         Deletes subject fields from the record that contain
         unsupported by BPL or NYPL thesauri
         """
-        subjects = self.subjects
-
-        for field in subjects:
-            if field.tag not in SUPPORTED_SUBJECT_TAGS:
-                self.remove_field(field)
-                continue
-            if field.indicator2 == "0":  # LCSH
-                continue
-            if field.indicator2 == "7":
-                if "2" in field:
-                    if field.get(code="2").strip() in SUPPORTED_THESAURI:
-                        continue
-                    else:
-                        self.remove_field(field)
-                else:
-                    self.remove_field(field)
-            else:
-                self.remove_field(field)
+        self.remove_fields_where(
+            lambda f: f.tag in _SUBJECT_TAGS and not _is_supported_subject(f)
+        )
 
     def physical_description(self) -> Optional[str]:
         """
         Returns value of the first 300 MARC tag in the bib
         """
-        try:
-            return self.physicaldescription()[0].value()  # type: ignore
-        except (TypeError, IndexError):
+        field = self._first_field("300")
+        if field is None:
             return None
+        return field.value()
 
     def record_type(self) -> Optional[str]:
         """
@@ -437,22 +616,18 @@ class Bib(Record):
         """
         Returns Sierra bib format fixed field code
         """
-        try:
-            return self.get("998").get(code="d").strip()  # type: ignore
-        except (TypeError, AttributeError):
+        value = self._first_subfield("998", "d")
+        if value is None:
             return None
+        return value.strip()
 
     def sierra_bib_id(self) -> Optional[str]:
         """
         Retrieves Sierra bib # from the 907 MARC tag
         """
-        try:
-            bib_id = self.get("907").get(code="a")[1:]  # type: ignore
-        except (TypeError, AttributeError):
-            return None
-
-        if bib_id:
-            return bib_id  # type: ignore
+        bib_id = self._first_subfield("907", "a")
+        if bib_id and len(bib_id) > 1:
+            return bib_id[1:]  # type: ignore
         else:
             return None
 
@@ -461,20 +636,20 @@ class Bib(Record):
         Retrieves Sierra bib # from the 907 tag and returns it
         without 'b' prefix and the check digit.
         """
-        try:
-            return self.sierra_bib_id()[1:-1]  # type: ignore
-        except TypeError:
+        bib_id = self.sierra_bib_id()
+        if bib_id is None:
             return None
+        return bib_id[1:-1]
 
     def subjects_lc(self) -> List[Field]:
         """
         Retrieves Library of Congress Subject Headings from the bib
         """
-        lc_subjects = []
-        for field in self.subjects:
-            if field.indicator2 == "0":
-                lc_subjects.append(field)
-        return lc_subjects
+        return [
+            field
+            for field in self.fields
+            if field.tag in _SUBJECT_TAGS and field.indicator2 == "0"
+        ]
 
     def suppressed(self) -> bool:
         """
@@ -482,46 +657,66 @@ class Bib(Record):
         BPL usage: "c", "n"
         NYPL usage: "c", "e", "n", "q", "o", "v"
         """
-        try:
-            code = self.get("998").get(code="e")  # type: ignore
-        except (TypeError, AttributeError):
-            return False
-
-        if code in ("c", "e", "n", "q", "o", "v"):
-            return True
-        else:
-            return False
+        return self._first_subfield("998", "e") in _SUPPRESSED_CODES
 
     def upc_number(self) -> Optional[str]:
         """
         Returns a UPC number if present on the bib.
         https://www.loc.gov/marc/bibliographic/bd024.html
         """
-        tag = self.get("024")
-        if tag:
-            if tag.indicator1 == "1":
-                try:
-                    return tag.get(code="a").strip()  # type: ignore
-                except AttributeError:
-                    pass
+        field = self._first_field("024")
+        if field is not None and field.indicator1 == "1":
+            value = field.get(code="a")
+            if value is not None:
+                return value.strip()  # type: ignore
         return None
 
 
-def pymarc_record_to_local_bib(record: Record, library: str) -> Optional[Bib]:
+def pymarc_record_to_local_bib(
+    record: Record, library: str, copy_fields: bool = True
+) -> Optional[Bib]:
     """
     Converts an instance of `pymarc.Record` to `bookops_marc.Bib`
 
     Args:
         record:                 `pymarc.Record` instance
         library:                'bpl' or 'nypl'
+        copy_fields:            if False, the list of fields is shared with
+                                the record instead of copied; use when the
+                                record is discarded after the conversion
 
     Returns:
         `bookops_marc.bib.Bib` instance
     """
     if isinstance(record, Record):
-        bib = Bib(library=library)
-        bib.leader = record.leader
-        bib.fields = record.fields[:]
-        return bib
+        return Bib._from_record(record, _normalize_library(library), copy_fields)
     else:
         return None
+
+
+def pymarc_records_to_local_bibs(
+    records: Iterable[Record], library: str, copy_fields: bool = True
+) -> List[Optional[Bib]]:
+    """
+    Converts multiple instances of `pymarc.Record` to `bookops_marc.Bib`
+
+    Args:
+        records:                iterable of `pymarc.Record` instances
+        library:                'bpl' or 'nypl'
+        copy_fields:            if False, lists of fields are shared with
+                                the records instead of copied
+
+    Returns:
+        list of `bookops_marc.bib.Bib` instances; None in place of any
+        object that is not `pymarc.Record`
+    """
+    from_record = Bib._from_record
+    library = _normalize_library(library)
+    return [
+        (
+            from_record(record, library, copy_fields)
+            if isinstance(record, Record)
+            else None
+        )
+        for record in records
+    ]
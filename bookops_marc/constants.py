@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
-SUPPORTED_THESAURI = ["lcsh", "fast", "gsafd", "lcgft", "lctgm", "bookops", "homoit"]
+SUPPORTED_THESAURI = frozenset(
+    ["lcsh", "fast", "gsafd", "lcgft", "lctgm", "bookops", "homoit"]
+)
 
-SUPPORTED_SUBJECT_TAGS = ["600", "610", "611", "630", "648", "650", "651", "655"]
+SUPPORTED_SUBJECT_TAGS = frozenset(
+    ["600", "610", "611", "630", "648", "650", "651", "655"]
+)
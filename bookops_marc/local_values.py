@@ -2,8 +2,18 @@
 This module contains helper methods for parsing and manipulating local Sierra fields
 """
 
-from datetime import datetime, date
-from typing import Union, Optional
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+
+# Dewey class mark cleanup and validation used by `normalize_dewey`
+_DEWEY_DELETE = str.maketrans("", "", "/jC'")
+_DEWEY_RE = re.compile(r"\A\d+(?:\.\d+)?\Z").match
+
+# prefixes of OCLC numbers recognized by `has_oclc_prefix`
+_OCLC_PREFIXES = ("ocm", "ocn", "on", "(ocolc)")
 
 
 def _add_oclc_prefix(value: str) -> str:
@@ -50,6 +60,54 @@ def _delete_oclc_prefix(value: str) -> str:
         return str(int(value))
 
 
+@lru_cache(maxsize=4096)
+def _normalize_date(order_date: str) -> Optional[date]:
+    """
+    Memoized body of `normalize_date`. The type of `order_date` is checked by
+    the caller, as unhashable values cannot be passed to a cached function.
+    """
+    # Sierra dates are coded as "MM-DD-YY" or "MM-DD-YYYY hh:mm"
+    if len(order_date) == 8:
+        digits = order_date[:2] + order_date[3:5] + order_date[6:8]
+    else:
+        digits = order_date[:2] + order_date[3:5] + order_date[6:10]
+    if (
+        order_date[2:3] != "-"
+        or order_date[5:6] != "-"
+        or len(digits) not in (6, 8)
+        or not (digits.isascii() and digits.isdigit())
+    ):
+        return None
+
+    year = int(digits[4:])
+    if len(digits) == 6:
+        # same century pivot as strptime's %y directive
+        year += 2000 if year < 69 else 1900
+    try:
+        return date(year, int(digits[:2]), int(digits[2:4]))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _normalize_dewey(class_mark: str) -> Optional[str]:
+    """
+    Memoized body of `normalize_dewey`. The type of `class_mark` is checked by
+    the caller, as unhashable values cannot be passed to a cached function.
+
+    Args:
+        class_mark:                  Dewey classification as `str`
+
+    Returns:
+        normalized class_mark
+    """
+    class_mark = class_mark.translate(_DEWEY_DELETE).replace("[B]", "").strip()
+    if _DEWEY_RE(class_mark) is None:
+        return None
+    # drop trailing zeros but never shorten below 4 characters
+    return class_mark[: max(len(class_mark.rstrip("0")), 4)]
+
+
 def get_branch_code(location_code: str) -> str:
     """
     Returns branch code from normalized location code
@@ -62,14 +120,10 @@ def get_shelf_audience_code(location_code: str) -> Optional[str]:
     """
     Parses audience code from given normalized location_code
     """
-    try:
-        audn = location_code[2].strip()
-        if audn:
-            return audn
-        else:
-            return None
-
-    except IndexError:
+    audn = location_code[2:3].strip()
+    if audn:
+        return audn
+    else:
         return None
 
 
@@ -77,13 +131,12 @@ def get_shelf_code(location_code: str) -> Optional[str]:
     """
     Parses shelf code from given normalized location_code
     """
-    try:
-        shelf = location_code[3:5].strip()
-        if shelf:
-            return shelf
-        else:
-            return None
-    except (TypeError, IndexError):
+    if not isinstance(location_code, str):
+        return None
+    shelf = location_code[3:5].strip()
+    if shelf:
+        return shelf
+    else:
         return None
 
 
@@ -95,16 +148,7 @@ def has_oclc_prefix(oclcNo: str) -> bool:
         oclcNo:         OCLC number expressed as a str:
     """
     if isinstance(oclcNo, str):
-        if (
-            oclcNo.lower().startswith("ocm")
-            or oclcNo.lower().startswith("ocn")
-            or oclcNo.lower().startswith("on")
-        ):
-            return True
-        elif oclcNo.lower().startswith("(ocolc)"):
-            return True
-        else:
-            return False
+        return oclcNo.lower().startswith(_OCLC_PREFIXES)
     else:
         raise TypeError("OCLC number must be a string.")
 
@@ -191,13 +235,9 @@ def normalize_date(order_date: str) -> Optional[date]:
     """
     Returns order created date in datetime format
     """
-    try:
-        if len(order_date) == 8:
-            return datetime.strptime(order_date[:8], "%m-%d-%y").date()
-        else:
-            return datetime.strptime(order_date[:10], "%m-%d-%Y").date()
-    except ValueError:
+    if not isinstance(order_date, str):
         return None
+    return _normalize_date(order_date)
 
 
 def normalize_dewey(class_mark: str) -> Optional[str]:
@@ -211,22 +251,7 @@ def normalize_dewey(class_mark: str) -> Optional[str]:
         normalized class_mark
     """
     if isinstance(class_mark, str):
-        class_mark = (
-            class_mark.replace("/", "")
-            .replace("j", "")
-            .replace("C", "")
-            .replace("[B]", "")
-            .replace("'", "")
-            .strip()
-        )
-        try:
-            float(class_mark)
-        except ValueError:
-            return None
-        else:
-            while len(class_mark) > 4 and class_mark[-1] == "0":
-                class_mark = class_mark[:-1]
-            return class_mark
+        return _normalize_dewey(class_mark)
     else:
         return None
 
@@ -235,12 +260,13 @@ def normalize_location_code(code: str) -> str:
     """
     Removes any quantity designation from location code value
     """
-    try:
-        s = code.index("(")
-        e = code.index(")")
-        return f"{code[:s]}{code[e + 1:]}"
-    except ValueError:
+    start = code.find("(")
+    if start < 0:
         return code
+    end = code.find(")")
+    if end < 0:
+        return code
+    return code[:start] + code[end + 1 :]
 
 
 def normalize_order_number(order_number: str) -> int:
@@ -250,6 +276,27 @@ def normalize_order_number(order_number: str) -> int:
     return int(order_number[2:-1])
 
 
+@lru_cache(maxsize=4096)
+def parse_location_code(code: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Parses branch, audience, and shelf codes from given location code
+    in a single call
+
+    Args:
+        code:                       location code, may include quantity
+
+    Returns:
+        tuple of branch, audience, and shelf codes
+    """
+    loc_code = normalize_location_code(code)
+    return (
+        get_branch_code(loc_code),
+        get_shelf_audience_code(loc_code),
+        get_shelf_code(loc_code),
+    )
+
+
+@lru_cache(maxsize=8192)
 def shorten_dewey(class_mark: str, digits_after_period: int = 4) -> str:
     """
     Shortens Dewey classification number to maximum 4 digits after period.
@@ -266,6 +313,5 @@ def shorten_dewey(class_mark: str, digits_after_period: int = 4) -> str:
 
     """
     class_mark = class_mark[: 4 + digits_after_period]
-    while len(class_mark) > 3 and class_mark[-1] in ".0":
-        class_mark = class_mark[:-1]
-    return class_mark
+    # drop trailing periods and zeros but never shorten below 3 characters
+    return class_mark[: max(len(class_mark.rstrip(".0")), 3)]
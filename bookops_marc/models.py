@@ -3,22 +3,18 @@
 """
 Data models used by bookops-marc
 """
-from collections import namedtuple
+from datetime import date
+from typing import List, NamedTuple, Optional
 
 
-Order = namedtuple(
-    "Order",
-    [
-        "oid",
-        "audn",
-        "branches",
-        "copies",
-        "created",
-        "form",
-        "lang",
-        "shelves",
-        "status",
-        "venNotes",
-    ],
-    defaults=[None, None, None, None, None, None, None, None, None],
-)
+class Order(NamedTuple):
+    oid: int
+    audn: Optional[List[Optional[str]]] = None
+    branches: Optional[List[str]] = None
+    copies: Optional[int] = None
+    created: Optional[date] = None
+    form: Optional[str] = None
+    lang: Optional[str] = None
+    shelves: Optional[List[Optional[str]]] = None
+    status: Optional[str] = None
+    venNotes: Optional[str] = None
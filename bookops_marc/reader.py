@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from typing import BinaryIO, Union
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Sequence, Union
 
 from pymarc import MARCReader
 from pymarc.constants import END_OF_RECORD
@@ -84,3 +87,113 @@ class SierraBibReader(MARCReader):
             )
         except Exception as ex:
             self._current_exception = ex
+
+
+def _read_chunks(marc_target: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yields chunks of a MARC file aligned on record boundaries
+
+    Args:
+        marc_target:            MARC file opened in binary mode
+        chunk_size:             approximate size of each chunk in bytes
+    """
+    end_of_record = END_OF_RECORD.encode()
+    remainder = b""
+    while True:
+        data = marc_target.read(chunk_size)
+        if not data:
+            break
+        data = remainder + data
+        boundary = data.rfind(end_of_record) + 1
+        if boundary:
+            yield data[:boundary]
+        remainder = data[boundary:]
+    if remainder:
+        yield remainder
+
+
+def _extract_chunk(
+    chunk: bytes, library: str, columns: Sequence[str], reader_options: Dict[str, Any]
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Parses records in the chunk and extracts values of given columns from
+    each of them. Records that could not be parsed, or for which any of the
+    accessors raised an exception, are returned as None.
+    """
+    # validates column names
+    Bib.batch_extract([], columns)
+    accessors = [(column, getattr(Bib, column)) for column in columns]
+
+    rows: List[Optional[Dict[str, Any]]] = []
+    for bib in SierraBibReader(chunk, library=library, **reader_options):
+        if bib is None:
+            rows.append(None)
+            continue
+        try:
+            rows.append({column: accessor(bib) for column, accessor in accessors})
+        except Exception:
+            # same as SierraBibReader, a bad record must not stop the stream
+            rows.append(None)
+    return rows
+
+
+def extract_in_parallel(
+    marc_target: BinaryIO,
+    columns: Sequence[str],
+    library: str = "",
+    workers: Optional[int] = None,
+    chunk_size: int = 10 * 1024 * 1024,
+    to_unicode: bool = True,
+    force_utf8: bool = False,
+    hide_utf8_warnings: bool = False,
+    utf8_handling: str = "strict",
+    file_encoding: str = "iso8859-1",
+    permissive: bool = False,
+) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Parses records of a MARC file in worker processes and yields values of given
+    columns for each record in the file order. Remaining arguments are passed
+    to `SierraBibReader` in the workers.
+
+    Args:
+        marc_target:            MARC file opened in binary mode
+        columns:                names of `Bib` accessor methods, for example
+                                "sierra_bib_id" or "dewey"
+        library:                'bpl' or 'nypl'
+        workers:                number of worker processes, defaults to the
+                                number of processors
+        chunk_size:             approximate size in bytes of file chunk sent
+                                to a worker process
+
+    Yields:
+        dictionary of column names and extracted values, or None in place of
+        a record that could not be parsed or for which an accessor raised
+        an exception
+    """
+    # validate columns before spawning any workers
+    Bib.batch_extract([], columns)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    reader_options = dict(
+        to_unicode=to_unicode,
+        force_utf8=force_utf8,
+        hide_utf8_warnings=hide_utf8_warnings,
+        utf8_handling=utf8_handling,
+        file_encoding=file_encoding,
+        permissive=permissive,
+    )
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # keep a bounded number of chunks in flight to limit memory use
+        max_pending = 2 * workers
+        pending: Deque[Future] = deque()
+        for chunk in _read_chunks(marc_target, chunk_size):
+            pending.append(
+                executor.submit(_extract_chunk, chunk, library, columns, reader_options)
+            )
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
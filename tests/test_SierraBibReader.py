@@ -1,4 +1,12 @@
-from bookops_marc import SierraBibReader
+from io import BytesIO
+
+import pytest
+
+from pymarc import Field, Subfield
+
+from bookops_marc import Bib, SierraBibReader
+from bookops_marc.errors import BookopsMarcError
+from bookops_marc.reader import _read_chunks, extract_in_parallel
 
 
 def test_SierraBibReader_iteration():
@@ -8,3 +16,88 @@ def test_SierraBibReader_iteration():
         for bib in reader:
             n += 1
         assert n == 9
+
+
+@pytest.mark.parametrize("arg", [1, 10, 1024 * 1024])
+def test_read_chunks_aligned_on_records(arg):
+    with open("tests/nyp-sample.mrc", "rb") as marcfile:
+        data = marcfile.read()
+    chunks = list(_read_chunks(BytesIO(data), arg))
+    assert b"".join(chunks) == data
+    assert all(chunk.endswith(b"\x1d") for chunk in chunks)
+
+
+def test_extract_in_parallel():
+    columns = ["sierra_bib_id", "dewey"]
+    with open("tests/nyp-sample.mrc", "rb") as marcfile:
+        reader = SierraBibReader(marcfile, library="nypl", hide_utf8_warnings=True)
+        expected = [{c: getattr(bib, c)() for c in columns} for bib in reader]
+    with open("tests/nyp-sample.mrc", "rb") as marcfile:
+        rows = list(
+            extract_in_parallel(
+                marcfile,
+                columns,
+                library="nypl",
+                workers=2,
+                chunk_size=4096,
+                hide_utf8_warnings=True,
+            )
+        )
+    assert len(rows) == 9
+    assert rows == expected
+
+
+def test_extract_in_parallel_keeps_unparsable_records_in_place():
+    bad_record = b"00026" + b"x" * 20 + b"\x1d"
+    with open("tests/nyp-sample.mrc", "rb") as marcfile:
+        data = marcfile.read()
+    rows = list(
+        extract_in_parallel(
+            BytesIO(bad_record + data + bad_record),
+            ["sierra_bib_id"],
+            library="nypl",
+            workers=2,
+            chunk_size=4096,
+            hide_utf8_warnings=True,
+        )
+    )
+    assert len(rows) == 11
+    assert rows[0] is None
+    assert rows[-1] is None
+    assert all(isinstance(row, dict) for row in rows[1:-1])
+
+
+def test_extract_in_parallel_keeps_records_with_accessor_errors_in_place():
+    bib = Bib()
+    bib.leader = "00000nam a2200000 a 4500"
+    bib.add_field(
+        Field(tag="907", subfields=[Subfield("a", ".b111111111")]),
+        Field(tag="960", subfields=[Subfield("z", ".o10000010")]),
+    )
+    bad_record = bib.as_marc()
+    with open("tests/nyp-sample.mrc", "rb") as marcfile:
+        data = marcfile.read()
+    columns = ["sierra_bib_id", "main_entry", "orders"]
+    rows = list(
+        extract_in_parallel(
+            BytesIO(data + bad_record + data),
+            columns,
+            library="nypl",
+            workers=2,
+            chunk_size=4096,
+            hide_utf8_warnings=True,
+        )
+    )
+    assert len(rows) == 19
+    assert rows[9] is None
+    assert all(isinstance(row, dict) for row in rows[:9] + rows[10:])
+    for row, other in zip(rows[:9], rows[10:]):
+        assert row["sierra_bib_id"] == other["sierra_bib_id"]
+        assert str(row["main_entry"]) == str(other["main_entry"])
+        assert row["orders"] == other["orders"]
+
+
+@pytest.mark.parametrize("arg", [["foo"], ["dewey", "dewey"]])
+def test_extract_in_parallel_invalid_columns(arg):
+    with pytest.raises(BookopsMarcError):
+        list(extract_in_parallel(BytesIO(b""), arg))
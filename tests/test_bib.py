@@ -7,15 +7,71 @@ from datetime import datetime
 
 import pytest
 
-from pymarc import Field, Subfield, Indicators
+from pymarc import Field, Subfield, Indicators, Record
 
 from bookops_marc.bib import (
+    _SUBJECT_TAGS,
     Bib,
     pymarc_record_to_local_bib,
+    pymarc_records_to_local_bibs,
 )
 from bookops_marc.errors import BookopsMarcError
 
 
+def test_batch_extract(stub_bib):
+    other_bib = deepcopy(stub_bib)
+    other_bib.add_field(Field(tag="907", subfields=[Subfield("a", ".b225444884")]))
+    assert Bib.batch_extract(
+        [stub_bib, other_bib], columns=["sierra_bib_id", "audience"]
+    ) == {"sierra_bib_id": [None, "b225444884"], "audience": ["j", "j"]}
+
+
+def test_batch_extract_does_not_modify_bibs(stub_bib):
+    stub_bib.add_field(
+        Field(
+            tag="650", indicators=Indicators(" ", "1"), subfields=[Subfield("a", "A")]
+        )
+    )
+    with pytest.raises(BookopsMarcError):
+        Bib.batch_extract([stub_bib], columns=["remove_unsupported_subjects"])
+    assert "650" in stub_bib
+
+
+def test_batch_extract_duplicate_columns(stub_bib):
+    with pytest.raises(BookopsMarcError) as exc:
+        Bib.batch_extract([stub_bib], columns=["dewey", "audience", "dewey"])
+    assert "Duplicate column names are not allowed." in str(exc.value)
+
+
+def test_batch_extract_none_items(stub_bib):
+    assert Bib.batch_extract(
+        [None, stub_bib, None], columns=["audience", "record_type"]
+    ) == {"audience": [None, "j", None], "record_type": [None, "a", None]}
+
+
+def test_batch_extract_no_bibs():
+    assert Bib.batch_extract([], columns=["dewey"]) == {"dewey": []}
+
+
+@pytest.mark.parametrize(
+    "arg",
+    [
+        "foo",
+        "library",
+        "_parse_locations",
+        "add_field",
+        "as_marc",
+        "normalize_oclc_control_number",
+        "remove_fields_where",
+        "remove_unsupported_subjects",
+    ],
+)
+def test_batch_extract_invalid_column(arg, stub_bib):
+    with pytest.raises(BookopsMarcError) as exc:
+        Bib.batch_extract([stub_bib], columns=[arg])
+    assert f"Invalid column name: '{arg}'." in str(exc.value)
+
+
 def test_sierra_bib_format_missing_tag(stub_bib):
     assert stub_bib.sierra_bib_format() is None
 
@@ -214,7 +270,16 @@ def test_created_date(stub_bib, arg, expectation):
 
 
 def test_created_date_missing_field(stub_bib):
-    stub_bib.created_date() is None
+    assert stub_bib.created_date() is None
+
+
+def test_sierra_907_dates_missing_subfields(stub_bib):
+    stub_bib.add_field(
+        Field(tag="907", subfields=[Subfield(code="a", value=".b225375965")])
+    )
+    assert stub_bib.cataloging_date() is None
+    assert stub_bib.created_date() is None
+    assert stub_bib.sierra_bib_id() == "b225375965"
 
 
 def test_cataloging_date(stub_bib):
@@ -239,6 +304,11 @@ def test_control_number_missing_001(stub_bib):
     assert stub_bib.control_number() is None
 
 
+def test_control_number_001_without_data(stub_bib):
+    stub_bib.add_field(Field(tag="001"))
+    assert stub_bib.control_number() is None
+
+
 @pytest.mark.parametrize(
     "arg,expectation", [("ocn12345", "ocn12345"), (" 12345 ", "12345")]
 )
@@ -255,6 +325,21 @@ def test_physical_description_no_300_tag(stub_bib):
     assert stub_bib.physical_description() is None
 
 
+def test_physical_description(stub_bib):
+    stub_bib.add_field(
+        Field(
+            tag="300",
+            indicators=Indicators(" ", " "),
+            subfields=[
+                Subfield(code="a", value="219 pages ;"),
+                Subfield(code="c", value="23 cm"),
+            ],
+        )
+    )
+    stub_bib.add_field(Field(tag="300", subfields=[Subfield(code="a", value="foo")]))
+    assert stub_bib.physical_description() == "219 pages ; 23 cm"
+
+
 @pytest.mark.parametrize(
     "tags,expectation",
     [
@@ -262,6 +347,7 @@ def test_physical_description_no_300_tag(stub_bib):
         (["110", "245"], "110"),
         (["111", "245"], "111"),
         (["245"], "245"),
+        (["245", "111", "110"], "110"),
     ],
 )
 def test_main_entry(stub_bib, tags, expectation):
@@ -308,6 +394,15 @@ def test_normalize_oclc_control_number(arg, lib, expectation, stub_bib):
     assert stub_bib.get("001").data == expectation
 
 
+@pytest.mark.parametrize("lib", ["bpl", "nypl"])
+def test_normalize_oclc_control_number_001_without_data(lib, stub_bib):
+    stub_bib.library = lib
+    stub_bib.add_field(Field(tag="001"))
+    stub_bib.normalize_oclc_control_number()
+
+    assert stub_bib.get("001").data is None
+
+
 def test_normalize_oclc_control_number_no_defined_library(stub_bib):
     stub_bib.add_field(Field(tag="001", data="ocm12345678"))
     with pytest.raises(BookopsMarcError) as exc:
@@ -318,6 +413,18 @@ def test_normalize_oclc_control_number_no_defined_library(stub_bib):
     )
 
 
+@pytest.mark.parametrize("arg", [None, "foo"])
+def test_normalize_oclc_control_number_no_defined_library_non_oclc(arg, stub_bib):
+    if arg is not None:
+        stub_bib.add_field(Field(tag="001", data=arg))
+    with pytest.raises(BookopsMarcError) as exc:
+        stub_bib.normalize_oclc_control_number()
+
+    assert "Not defined library argument to apply the correct practice." in str(
+        exc.value
+    )
+
+
 def test_dewey_no_082(stub_bib):
     assert stub_bib.dewey() is None
 
@@ -510,7 +617,111 @@ def test_oclc_nos_001_only(stub_bib):
     assert stub_bib.oclc_nos() == {"001": "12345678"}
 
 
-@pytest.mark.parametrize("arg", [1, "foo"])
+def test_bib_slots(stub_bib):
+    assert not hasattr(stub_bib, "__dict__")
+    with pytest.raises(AttributeError):
+        stub_bib.foo = "bar"
+
+
+def test_iteration(stub_bib):
+    assert [f.tag for f in stub_bib] == ["008", "100", "245", "264"]
+    assert [f.tag for f in stub_bib] == ["008", "100", "245", "264"]
+
+
+def test_tag_index(stub_bib):
+    stub_bib.add_field(Field(tag="907", subfields=[Subfield("a", ".b111111111")]))
+    stub_bib.add_field(Field(tag="907", subfields=[Subfield("a", ".b222222222")]))
+    idx = stub_bib._tag_index()
+    assert sorted(idx.keys()) == ["008", "100", "245", "264", "907"]
+    assert [f.get("a") for f in idx["907"]] == [".b111111111", ".b222222222"]
+    assert stub_bib._first_field("907").get("a") == ".b111111111"
+    assert stub_bib._first_field("999") is None
+    assert stub_bib._tag_index() is idx
+
+
+def test_tag_index_agrees_with_pymarc_lookups_after_mutations(stub_bib):
+    def assert_agree(bib):
+        for tag in ("245", "650", "907", "999"):
+            assert bib._first_field(tag) is bib.get(tag)
+            assert (bib._first_field(tag) is not None) is (tag in bib)
+            assert bib._tag_index().get(tag, []) == bib.get_fields(tag)
+        assert bib.sierra_bib_id() == (bib["907"]["a"][1:] if "907" in bib else None)
+
+    assert_agree(stub_bib)
+    stub_bib.add_field(Field(tag="907", subfields=[Subfield("a", ".b111111111")]))
+    stub_bib.add_field(Field(tag="650", subfields=[Subfield("a", "foo")]))
+    assert_agree(stub_bib)
+    stub_bib.fields[-1] = Field(tag="650", subfields=[Subfield("a", "bar")])
+    assert_agree(stub_bib)
+    stub_bib.fields[-1].tag = "999"
+    assert_agree(stub_bib)
+    stub_bib.remove_fields("907", "245")
+    assert_agree(stub_bib)
+
+
+def test_tag_index_rebuilt_after_field_removal(stub_bib):
+    stub_bib.add_field(Field(tag="907", subfields=[Subfield("a", ".b111111111")]))
+    assert stub_bib.sierra_bib_id() == "b111111111"
+    stub_bib.remove_fields("907")
+    stub_bib.add_field(Field(tag="999", subfields=[Subfield("a", "foo")]))
+    assert stub_bib.sierra_bib_id() is None
+    assert "999" in stub_bib._tag_index()
+
+
+def test_tag_index_rebuilt_after_same_length_replacement(stub_bib):
+    stub_bib.add_field(Field(tag="907", subfields=[Subfield("a", ".b111111111")]))
+    assert stub_bib.sierra_bib_id() == "b111111111"
+    assert stub_bib.main_entry().tag == "100"
+
+    stub_bib.fields[-1] = Field(tag="907", subfields=[Subfield("a", ".b222222222")])
+    assert stub_bib.sierra_bib_id() == "b222222222"
+    assert stub_bib["907"].get("a") == ".b222222222"
+
+    main = stub_bib.fields[1]
+    stub_bib.fields.remove(main)
+    stub_bib.fields.insert(0, Field(tag="500", subfields=[Subfield("a", "foo")]))
+    assert "100" not in stub_bib
+    assert stub_bib.main_entry().tag == "245"
+    assert stub_bib._first_field("500").get("a") == "foo"
+
+
+def test_tag_index_rebuilt_after_tag_change_in_place(stub_bib):
+    stub_bib.add_field(Field(tag="907", subfields=[Subfield("a", ".b111111111")]))
+    assert stub_bib.sierra_bib_id() == "b111111111"
+
+    stub_bib.fields[-1].tag = "908"
+    assert stub_bib.sierra_bib_id() is None
+    assert stub_bib.get("907") is None
+
+    stub_bib.fields[-1].tag = "907"
+    assert stub_bib.sierra_bib_id() == "b111111111"
+
+
+def test_tag_index_rebuilt_after_direct_fields_change(stub_bib):
+    stub_bib._tag_index()
+    stub_bib.fields.append(
+        Field(tag="907", subfields=[Subfield("a", ".b111111111")]),
+    )
+    assert stub_bib.sierra_bib_id() == "b111111111"
+
+
+def test_parse_locations(stub_bib):
+    field = Field(
+        tag="960",
+        subfields=[
+            Subfield(code="t", value="(2)41anf"),
+            Subfield(code="t", value="snj0y"),
+            Subfield(code="t", value="tb"),
+        ],
+    )
+    assert stub_bib._parse_locations(field) == (
+        ["41", "sn", "tb"],
+        ["a", "j", None],
+        ["nf", "0y", None],
+    )
+
+
+@pytest.mark.parametrize("arg", [1, "foo", "end", "ascend", ",", "", ["ascending"]])
 def test_orders_exceptions(arg, stub_bib, mock_960):
     msg = "Invalid 'sort' argument was passed."
     stub_bib.add_field(mock_960)
@@ -835,7 +1046,70 @@ def test_overdrive_number(arg, expectation, stub_bib):
 def test_remove_unsupported_subjects(stub_bib, field, expectation):
     stub_bib.add_field(field)
     stub_bib.remove_unsupported_subjects()
-    (field.tag in stub_bib) == expectation
+    assert (field.tag in stub_bib) == expectation
+
+
+def test_remove_unsupported_subjects_multiple(stub_bib):
+    stub_bib.add_field(
+        Field(
+            tag="650", indicators=Indicators(" ", "0"), subfields=[Subfield("a", "A")]
+        ),
+        Field(
+            tag="650", indicators=Indicators(" ", "1"), subfields=[Subfield("a", "B")]
+        ),
+        Field(
+            tag="690", indicators=Indicators(" ", "0"), subfields=[Subfield("a", "C")]
+        ),
+        Field(
+            tag="655",
+            indicators=Indicators(" ", "7"),
+            subfields=[Subfield("a", "D"), Subfield("2", "lcgft")],
+        ),
+        Field(
+            tag="500", indicators=Indicators(" ", " "), subfields=[Subfield("a", "E")]
+        ),
+    )
+    stub_bib.remove_unsupported_subjects()
+    assert [f.tag for f in stub_bib.fields] == [
+        "008",
+        "100",
+        "245",
+        "264",
+        "650",
+        "655",
+        "500",
+    ]
+    assert [f.get("a") for f in stub_bib.get_fields("650")] == ["A"]
+
+
+def test_remove_fields_where(stub_bib):
+    stub_bib.add_field(
+        Field(
+            tag="500", indicators=Indicators(" ", " "), subfields=[Subfield("a", "A")]
+        ),
+        Field(
+            tag="500", indicators=Indicators(" ", " "), subfields=[Subfield("a", "B")]
+        ),
+    )
+    assert "500" in stub_bib
+    stub_bib.remove_fields_where(lambda f: f.tag == "500" or f.tag == "264")
+    assert [f.tag for f in stub_bib.fields] == ["008", "100", "245"]
+    assert "500" not in stub_bib
+    assert stub_bib.get_fields("264") == []
+
+
+def test_remove_fields_where_no_match(stub_bib):
+    fields = stub_bib.fields
+    stub_bib.remove_fields_where(lambda f: False)
+    assert stub_bib.fields is fields
+    assert [f.tag for f in stub_bib.fields] == ["008", "100", "245", "264"]
+
+
+def test_subject_tags_match_pymarc_subjects():
+    record = Record()
+    for n in range(600, 700):
+        record.add_field(Field(tag=str(n), subfields=[Subfield(code="a", value="foo")]))
+    assert _SUBJECT_TAGS == {f.tag for f in record.subjects}
 
 
 def test_subjects_lc(stub_bib):
@@ -977,6 +1251,39 @@ def test_instating_from_pymarc_record(stub_pymarc_record, arg):
     assert str(bib.main_entry()) == "=100  1\\$aAdams, John,$eauthor."
 
 
+def test_instating_from_pymarc_record_copies_fields(stub_pymarc_record):
+    bib = pymarc_record_to_local_bib(stub_pymarc_record, "NYPL")
+    assert bib.library == "nypl"
+    assert bib.leader is stub_pymarc_record.leader
+    assert bib.fields == stub_pymarc_record.fields
+    assert bib.fields is not stub_pymarc_record.fields
+    assert bib.audience() == "j"
+    assert bib.as_marc() == stub_pymarc_record.as_marc()
+
+
+def test_instating_from_pymarc_record_sharing_fields(stub_pymarc_record):
+    bib = pymarc_record_to_local_bib(stub_pymarc_record, "nypl", copy_fields=False)
+    assert bib.fields is stub_pymarc_record.fields
+    assert bib.audience() == "j"
+
+
 @pytest.mark.parametrize("arg", ["bpl", "nypl", None])
 def test_from_pymarc_record_invalid(mock_960, arg):
     assert pymarc_record_to_local_bib(mock_960, arg) is None
+
+
+def test_pymarc_records_to_local_bibs(stub_pymarc_record, mock_960):
+    bibs = pymarc_records_to_local_bibs(
+        [stub_pymarc_record, mock_960, stub_pymarc_record], "BPL"
+    )
+    assert len(bibs) == 3
+    assert bibs[1] is None
+    for bib in (bibs[0], bibs[2]):
+        assert isinstance(bib, Bib)
+        assert bib.library == "bpl"
+        assert bib.fields == stub_pymarc_record.fields
+    assert bibs[0].fields is not bibs[2].fields
+
+
+def test_pymarc_records_to_local_bibs_empty():
+    assert pymarc_records_to_local_bibs([], "nypl") == []
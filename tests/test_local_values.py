@@ -17,6 +17,7 @@ from bookops_marc.local_values import (
     normalize_date,
     normalize_location_code,
     normalize_order_number,
+    parse_location_code,
 )
 
 
@@ -174,7 +175,11 @@ def test_oclcNo_without_prefix_exception(arg):
         ("505 ", "505"),
         ("900", "900"),
         ("900.100", "900.1"),
+        ("inf", None),
+        ("1e3", None),
         (None, None),
+        (813, None),
+        (["813"], None),
     ],
 )
 def test_normalize_dewey(arg, expectation):
@@ -189,12 +194,27 @@ def test_normalize_dewey(arg, expectation):
         ("41anf(5)", "41anf"),
         ("41anf", "41anf"),
         ("(3)snj0y", "snj0y"),
+        ("(3snj0y", "(3snj0y"),
+        ("a(1)b(2)c", "ab(2)c"),
     ],
 )
 def test_normalize_location_code(arg, expectation, stub_bib):
     assert normalize_location_code(arg) == expectation
 
 
+@pytest.mark.parametrize(
+    "arg,expectation",
+    [
+        ("(2)41anf", ("41", "a", "nf")),
+        ("snj0y", ("sn", "j", "0y")),
+        ("tb", ("tb", None, None)),
+        ("13anb(3)", ("13", "a", "nb")),
+    ],
+)
+def test_parse_location_code(arg, expectation):
+    assert parse_location_code(arg) == expectation
+
+
 @pytest.mark.parametrize(
     "arg,expectation",
     [("41anf", "41"), ("02jje", "02"), ("snj0f", "sn"), ("fty0n", "ft")],
@@ -208,7 +228,15 @@ def test_get_branch_code(arg, expectation):
     [
         ("01-30-21", datetime(2021, 1, 30)),
         ("08-02-2021 16:19", datetime(2021, 8, 2)),
+        ("08-02-2021", datetime(2021, 8, 2)),
+        ("12-31-99", datetime(1999, 12, 31)),
+        ("02-30-21", None),
+        ("08-02-202", None),
+        ("08/02/21", None),
         ("  -  -  ", None),
+        ("", None),
+        (None, None),
+        (["01-30-21"], None),
     ],
 )
 def test_normalize_date(arg, expectation):
@@ -234,6 +262,7 @@ def test_get_shelf_audience_code(arg, expectation):
         ("tb", None),
         ("tb   ", None),
         (None, None),
+        (["41anf"], None),
     ],
 )
 def test_get_shelf_code(arg, expectation):
@@ -251,6 +280,7 @@ def test_normalize_order_number():
         ("362.84924043809049", 4, "362.8492"),
         ("362.849040", 4, "362.849"),
         ("900", 4, "900"),
+        ("900.00", 4, "900"),
         ("512.1234", 2, "512.12"),
     ],
 )